@@ -1,25 +1,34 @@
 import reflex as rx
 import datetime
-from reflextest3.stilos.stilos import Size as Size
-from reflextest3.stilos.colors import TextColor as TextColor
+from types import MappingProxyType
+from reflextest3.stilos.stilos import Size
+from reflextest3.stilos.colors import TextColor
 import reflextest3.constants as const
 
+_SIZE_MEDIUM = Size.MEDIUM.value
+_SIZE_BIG = Size.BIG.value
+_COLOR_FOOTER = TextColor.FOOTER.value
+
+_VSTACK_KW = MappingProxyType({
+    "align": "center",  # Centra los elementos horizontalmente
+    "justify": "center", # Centra los elementos verticalmente
+    "margin_bottom": _SIZE_MEDIUM,
+    "padding_y": _SIZE_BIG,
+    "font_size": _SIZE_MEDIUM,
+})
+
+_FOOTER_TEXT = f"2020-{datetime.date.today().year} wjsequera@gmail.com. python developer practice"
+
 def footer()-> rx.Component:
     return rx.vstack(
                 rx.image(src="publicidadScada.png", width="80px", height="80px", margin_bottom="0px"),
-                rx.link(f"2020-{datetime.date.today().year} wjsequera@gmail.com. python developer practice",
+                rx.link(_FOOTER_TEXT,
                         href=const.WJSSEQUERA_TWICH,
                         is_external=True,margin_top="0px"
                         ),
                 rx.text("2025 wjsequera@gmail.com. python developer practice",
                         margin_top="0px",
-                        color=TextColor.FOOTER.value
+                        color=_COLOR_FOOTER
                         ),
-        align="center",  # Centra los elementos horizontalmente
-        justify="center", # Centra los elementos verticalmente
-        margin_bottom=Size.MEDIUM.value,
-        #padding_bottom=Size.BIG.value,
-        padding_y=Size.BIG.value,
-        font_size=Size.MEDIUM.value,
-        #bg="white"
+        **_VSTACK_KW
     )
@@ -1,20 +1,22 @@
 import reflex as rx
-from reflextest3.stilos.stilos import Size as Size
-from reflextest3.stilos.colors import Color as Color
-from reflextest3.stilos.colors import TextColor as TextColor
-3
+from reflextest3.stilos.stilos import Size
+from reflextest3.stilos.colors import Color, TextColor
+
+_SIZE_MEDIUM = Size.MEDIUM.value
+_COLOR_PRIMARY = Color.PRIMARY.value
+_COLOR_BODY = TextColor.BODY.value
 
 def info_text(title:str, body:str)-> rx.Component:
     return rx.box(
                 rx.hstack(
                     rx.text(title, 
                             font_weight="bold", 
-                            color=Color.PRIMARY.value),
+                            color=_COLOR_PRIMARY),
                     rx.text(body, 
-                            color=TextColor.BODY.value)  #orange
+                            color=_COLOR_BODY)  #orange
                 ),
                 
-            font_size=Size.MEDIUM.value,
+            font_size=_SIZE_MEDIUM,
             width="100%"
 
     )
@@ -1,15 +1,19 @@
 import reflex as rx
 import reflextest3.stilos.stilos as stilos
-from reflextest3.stilos.stilos  import Size as Size
+from reflextest3.stilos.stilos import Size
+
+_SIZE_BIG = Size.BIG.value
+_SPACING_SMALL = Size.Small.value
+
 def link_button(title:str,body:str, url:str,imagen:str)-> rx.Component:
     return rx.link(
         rx.button(
             rx.hstack(
                 #rx.icon(tag="arrow_forward"),            
-                rx.image(src=imagen,width=stilos.Size.BIG, height=stilos.Size.BIG),
+                rx.image(src=imagen,width=_SIZE_BIG, height=_SIZE_BIG),
                 rx.vstack(rx.text(title,style=stilos.button_title_style),
                           rx.text(body,style=stilos.button_body_style),
-                          spacing=Size.Small.value
+                          spacing=_SPACING_SMALL
                 )
         
             ),  width="100%"
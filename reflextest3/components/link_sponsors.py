@@ -1,13 +1,14 @@
 import reflex as rx
-import reflextest3.stilos.stilos as stilos
-from reflextest3.stilos.stilos import Size as Size
+from reflextest3.stilos.stilos import Size
+
+_SIZE_VBIG = Size.VBIG.value
 
 def link_sponsors(imagen:str, url: str)-> rx.Component:
     return rx.link(
                 rx.image(
                   src=imagen,
-                  height=Size.VBIG.value,
-                  width=Size.VBIG.value,
+                  height=_SIZE_VBIG,
+                  width=_SIZE_VBIG,
                 ),
             href=url,
             is_external=True,
@@ -1,7 +1,7 @@
 import reflex as rx
 import reflextest3.stilos.stilos as stilos
-from reflextest3.stilos.stilos import Size as Size
-from reflextest3.stilos.colors import Color as Color
+from reflextest3.stilos.stilos import Size
+from reflextest3.stilos.colors import Color
 
 def navbar()-> rx.Component:
     return rx.hstack(
@@ -1,9 +1,10 @@
 import reflex as rx
-import reflextest3.stilos.stilos as stilos
+from reflextest3.stilos.stilos import title_style as _TITLE_STYLE
 
+@rx.memo
 def title(text: str)-> rx.Component:
     return  rx.heading(
             text,
             size="5",
-            style=stilos.title_style
+            style=_TITLE_STYLE
     )
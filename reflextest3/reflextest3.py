@@ -4,8 +4,7 @@ from reflextest3.components.footer import footer
 from reflextest3.views.header.header import header
 from reflextest3.views.links.links import links
 import reflextest3.stilos.stilos as stilos
-from reflextest3.stilos.colors import Color as Color
-from reflextest3.stilos.stilos import Size as Size  # usar Size Directo de nuesta fuente de stilos.py
+from reflextest3.stilos.stilos import Size  # usar Size Directo de nuesta fuente de stilos.py
 from reflextest3.views.sponsors.sponsors import sponsor
 class State(rx.State):
     pass
@@ -58,10 +57,14 @@ def index()-> rx.Component:
     )#box1
 app= rx.App(
     stylesheets=stilos.STYLESHEETS,
-    style=stilos.BASE_STYLE
+    style=stilos.BASE_STYLE,
+    head_components=[
+        # imagenes visibles al cargar la pagina: el navegador las pide antes de hidratar
+        rx.el.link(rel="preload", href="/avatar.png", custom_attrs={"as": "image"}),
+        rx.el.link(rel="preload", href="/publicidadScada.png", custom_attrs={"as": "image"}),
+    ]
 )
 app.add_page(index,
              title="Ing. Willians J. Sequera",
              description= "Python con Reflex",
              image="icons/avatar.png")
-app._compile()
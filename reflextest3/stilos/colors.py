@@ -1,4 +1,3 @@
-import reflex as rx
 from enum import Enum
 
 
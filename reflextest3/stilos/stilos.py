@@ -1,10 +1,8 @@
 
 import reflex as rx
 from enum import Enum
-from .colors import Color as  Color
-from .colors import TextColor as  TextColor
-from .fonts import Font as  Font
-from .fonts import FontWeight as  FontWeight
+from .colors import Color, TextColor
+from .fonts import Font, FontWeight
 
 # Constantes
 MAX_WIDTH= "600px"
@@ -1,41 +1,68 @@
 import reflex as rx
+from types import MappingProxyType
 from reflextest3.components.link_icon import link_icon
 import reflextest3.stilos.stilos as stilos
 from reflextest3.components.info_text import info_text
-from reflextest3.stilos.colors import TextColor as TextColor
-from reflextest3.stilos.colors import Color as Color
-from reflextest3.stilos.stilos import Size as Size
+from reflextest3.stilos.colors import Color, TextColor
+from reflextest3.stilos.stilos import Size
 import reflextest3.constants as const
+
+_SIZE_MEDIUM = Size.MEDIUM.value
+_SPACING_BIG = Size.Big.value
+_COLOR_PRIMARY = Color.PRIMARY.value
+_COLOR_AVATAR = TextColor.PRIMARYY.value
+_COLOR_HEADER = TextColor.HEADER.value
+_COLOR_BODY = TextColor.BODY.value
+
+_HEADER_LINKS = (
+    const.WJSEQUERA_SITE_GOOGLE,
+    const.WJSEQUERA_YOUTUBE,
+    const.WJSSEQUERA_TWICH,
+    const.WJSEQUERA_SITE_REFLEX,
+)
+
+_VSTACK_KW = MappingProxyType({
+    "align": "center",  # Centra los elementos horizontalmente
+    "justify": "center",  # Centra los elementos verticalmente
+    "width": "100%",
+    "spacing": _SPACING_BIG, # BIG = "4em" Big="6"
+})
+_HSTACK_KW = MappingProxyType({
+    "width": "100%",
+    "spacing": _SPACING_BIG,
+})
+_FLEX_KW = MappingProxyType({
+    "width": "100%",
+    "align": "center",
+})
+
 def header()-> rx.Component:
     return rx.vstack(
                 rx.hstack(
                          rx.avatar(fallback="WS",
                                    size="8",
-                                   color=TextColor.PRIMARYY.value,
+                                   color=_COLOR_AVATAR,
                                    src="avatar.png",
                                    padding="2px",
-                                   border_color=Color.PRIMARY.value,
+                                   border_color=_COLOR_PRIMARY,
                                    radius="full",
                                    border="5px",
-                                   bg=Color.PRIMARY.value
+                                   bg=_COLOR_PRIMARY
 
                                 ),
                          rx.vstack(
                             rx.heading("Ing. Willians J. Sequera",
                                        align="left",
-                                       color=TextColor.HEADER.value,
+                                       color=_COLOR_HEADER,
                                        style=stilos.navbar_title_style
                                        ),
                             rx.text("wjsequera@", 
-                                    color=TextColor.BODY.value,
+                                    color=_COLOR_BODY,
                                     margin_top="0px",
                                     align="left", 
                                     width="100%"),  #,font_weight="bold"
                             rx.hstack(
-                                link_icon(const.WJSEQUERA_SITE_GOOGLE),
-                                link_icon(const.WJSEQUERA_YOUTUBE),
-                                link_icon(const.WJSSEQUERA_TWICH),
-                                link_icon(const.WJSEQUERA_SITE_REFLEX),
+                                *[link_icon(u) for u in _HEADER_LINKS],
                                 ),
                         
                                  align="start", 
@@ -44,10 +71,7 @@ def header()-> rx.Component:
                                  #padding="16px"                                
                         
                         ),
-                    #justify="center",
-                    width="100%",
-                    #bg="black"
-                    spacing=stilos.Size.Big.value
+                    **_HSTACK_KW
                     ),
                     rx.flex(
                         info_text("+25","Anos de Experiencia"),
@@ -55,9 +79,7 @@ def header()-> rx.Component:
                         info_text("+8", "Tranbajos Propios"),
                         rx.spacer(),
                         info_text("+1", "Programador"),
-                        width="100%",
-                        align="center"
-
+                        **_FLEX_KW
                 ),  
 
         rx.box(           
@@ -65,18 +87,12 @@ def header()-> rx.Component:
                 #ith env var FRONTEND_PORT=3000 Info: Overriding config value
                 #backend_port with env var BACKEND_PORT=8000")""",
                 const.PRESENTACION,
-                color=TextColor.BODY.value,
-                font_size=Size.MEDIUM.value,
+                color=_COLOR_BODY,
+                font_size=_SIZE_MEDIUM,
                 
                 ),
                 #width="40%"
                  ),
-                align="center",  # Centra los elementos horizontalmente
-                justify="center",  # Centra los elementos verticalmente
-                width="100%",
-                spacing=stilos.Size.Big.value # BIG = "4em" Big="6"
-                #spacing=Size.Big.value    # Arriba en la cabezera hay que from reflextest.stilos.stilos import Size as Size
-           
-                    #align="center"
+                **_VSTACK_KW
                       )
     
@@ -1,12 +1,22 @@
 import reflex as rx
+from types import MappingProxyType
 from reflextest3.components.title import title
 import reflextest3.constants as const
 from reflextest3.components.link_sponsors import link_sponsors
-from reflextest3.stilos.stilos import Size as Size
+from reflextest3.stilos.stilos import Size
+
+_SPACING_MEDIUM = Size.Medium.value
+
+_VSTACK_KW = MappingProxyType({
+    "align": "center",  # Centra los elementos horizontalmente
+    "justify": "center",  # Centra los elementos verticalmente
+    "width": "100%",
+    "spacing": _SPACING_MEDIUM,
+})
 
 def sponsor()-> rx.Component:
     return rx.vstack(     
-        title("Colaboran"),  
+        title(text="Colaboran"),  
         rx.hstack(
             #rx.image(src="publicidadScada.png", width="80px", height="80px", margin_bottom="0px"),
             link_sponsors("publicidadCurso.png",const.WJSSEQUERA_TWICH),
@@ -15,9 +25,5 @@ def sponsor()-> rx.Component:
             width="100%"
         
         ),
-           align="center",  # Centra los elementos horizontalmente
-           justify="center",  # Centra los elementos verticalmente 
-           width="100%",
-           spacing=Size.Medium.value,
-           
+        **_VSTACK_KW
     )